@@ -1,10 +1,16 @@
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from bson import ObjectId
 from pydantic import BaseModel, Field
+from pymongo import DESCENDING
 from pymongo.collection import Collection
 
-from utils.db import get_resource_collection
+from api.responses import MongoJSONResponse
+from collectors.rate_limiter import throttle_registry
+from utils.db import get_resource_collection, get_audit_log_collection
+from utils.diff import get_diff
+from utils.digest import normalize_resource
 from models.resource import Resource
 from cluster_config import CLUSTERS
 
@@ -18,6 +24,51 @@ class RelatedNamespaceOut(BaseModel):
     namespace: str
     cluster_name: str
 
+class DriftCopyOut(BaseModel):
+    id: str
+    cluster_name: str
+    namespace: str
+
+class DriftVariantOut(BaseModel):
+    content_digest: Optional[str] = None
+    copies: List[DriftCopyOut]
+    diff: Optional[Dict[str, Any]] = None
+
+class DriftReportOut(BaseModel):
+    resource_type: str
+    resource_name: str
+    identical: bool
+    variants: List[DriftVariantOut]
+
+class AuditLogOut(BaseModel):
+    id: str = Field(alias="_id")
+    resource_id: str
+    cluster_name: Optional[str] = None
+    namespace: Optional[str] = None
+    resource_type: Optional[str] = None
+    resource_name: Optional[str] = None
+    old_version: Optional[str] = None
+    new_version: str
+    changed_paths: List[str] = []
+    changed_at: datetime
+    diff: Optional[Dict[str, Any]] = None
+
+class AuditPageOut(BaseModel):
+    items: List[AuditLogOut]
+    next_cursor: Optional[str] = Field(None, description="Pass as `cursor` to fetch the next (older) page.")
+
+class CollectorMetricsOut(BaseModel):
+    cluster_name: str
+    requests: int
+    throttled: int
+    errors: int
+    retries: int
+    avg_latency_seconds: float
+    max_latency_seconds: float
+    concurrency_limit: int
+    qps: float
+    burst: int
+
 class ResourceOut(Resource):
     id: str = Field(alias="_id")
 
@@ -25,6 +76,18 @@ class ResourceOut(Resource):
         arbitrary_types_allowed = True
         json_encoders = {ObjectId: str}
 
+class ResourceSummaryOut(BaseModel):
+    id: str = Field(alias="_id")
+    cluster_name: str
+    namespace: str
+    resource_type: str
+    resource_name: str
+    resource_version: str
+    summary: Optional[Dict[str, Any]] = None
+
+# Fields returned by the summary listing, leaving out the full resource data.
+SUMMARY_PROJECTION = {field: 1 for field in ResourceSummaryOut.model_fields if field != "id"}
+
 def _query_resources(
     collection: Collection,
     keyword: Optional[str] = None,
@@ -32,10 +95,15 @@ def _query_resources(
     namespace: Optional[str] = None,
     resource_type: Optional[str] = None,
     resource_name: Optional[str] = None,
+    image: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
-) -> List[ResourceOut]:
-    """Internal function to query resources from the database."""
+    projection: Optional[dict] = None,
+) -> List[dict]:
+    """
+    Internal function to query resources from the database. The raw documents
+    are returned as-is, to be serialized by `MongoJSONResponse`.
+    """
     query_parts = []
 
     if cluster_name:
@@ -47,6 +115,8 @@ def _query_resources(
     if resource_name:
         name_regex = {"$regex": resource_name, "$options": "i"}
         query_parts.append({"resource_name": name_regex})
+    if image:
+        query_parts.append({"summary.Containers.Image": image})
 
     if keyword:
         keyword_regex = {"$regex": keyword, "$options": "i"}
@@ -54,14 +124,63 @@ def _query_resources(
 
     query = {"$and": query_parts} if query_parts else {}
 
-    cursor = collection.find(query).skip(skip).limit(limit)
+    cursor = collection.find(query, projection).skip(skip).limit(limit)
 
-    results = []
-    for doc in cursor:
-        doc["_id"] = str(doc["_id"])
-        results.append(doc)
+    return list(cursor)
 
-    return results
+def _encode_audit_cursor(doc: dict) -> str:
+    """Builds the keyset cursor pointing just past the given audit log entry."""
+    return f"{doc['changed_at'].isoformat()}|{doc['_id']}"
+
+def _decode_audit_cursor(cursor: str) -> tuple:
+    try:
+        changed_at, last_id = cursor.split("|")
+        return datetime.fromisoformat(changed_at), ObjectId(last_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def _query_audit_logs(
+    collection: Collection,
+    filters: dict,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50,
+    include_diff: bool = False,
+) -> dict:
+    """
+    Internal function to page through audit logs, newest first. Pages are
+    keyed on (`changed_at`, `_id`), so each page is a single index range scan
+    no matter how deep the client has paged.
+    """
+    query = dict(filters)
+
+    time_range = {}
+    if since:
+        time_range["$gte"] = since
+    if until:
+        time_range["$lt"] = until
+    if time_range:
+        query["changed_at"] = time_range
+
+    if cursor:
+        changed_at, last_id = _decode_audit_cursor(cursor)
+        query["$or"] = [
+            {"changed_at": {"$lt": changed_at}},
+            {"changed_at": changed_at, "_id": {"$lt": last_id}},
+        ]
+
+    # Full diffs can be large, so only the changed paths are returned by default
+    projection = None if include_diff else {"diff": 0}
+
+    docs = list(
+        collection.find(query, projection)
+        .sort([("changed_at", DESCENDING), ("_id", DESCENDING)])
+        .limit(limit + 1)
+    )
+
+    next_cursor = _encode_audit_cursor(docs[limit - 1]) if len(docs) > limit else None
+    return {"items": docs[:limit], "next_cursor": next_cursor}
 
 def fetch_unique_values(field: str, collection: Collection = Depends(get_resource_collection)) -> List[str]:
     """Fetches unique values for a given field from the resources collection."""
@@ -87,19 +206,48 @@ def get_resources(
     namespace: Optional[str] = Query(None, description="Filter results by namespace."),
     resource_type: Optional[str] = Query(None, description="Filter results by resource type (e.g., Deployment)."),
     resource_name: Optional[str] = Query(None, description="Filter results by resource name (supports partial matching)."),
+    image: Optional[str] = Query(None, description="Filter results by exact container image (e.g., nginx:1.25)."),
     skip: int = Query(0, description="The number of records to skip for pagination."),
     limit: int = Query(100, description="The maximum number of records to return."),
 ):
-    return _query_resources(
+    return MongoJSONResponse(_query_resources(
         collection=collection,
         keyword=keyword,
         cluster_name=cluster_name,
         namespace=namespace,
         resource_type=resource_type,
         resource_name=resource_name,
+        image=image,
         skip=skip,
         limit=limit,
-    )
+    ))
+
+@router.get("/api/summaries", response_model=List[ResourceSummaryOut], summary="List resource summaries without their full data")
+def get_resource_summaries(
+    collection: Collection = Depends(get_resource_collection),
+    cluster_name: Optional[str] = Query(None, description="Filter results by cluster name."),
+    namespace: Optional[str] = Query(None, description="Filter results by namespace."),
+    resource_type: Optional[str] = Query(None, description="Filter results by resource type (e.g., Deployment)."),
+    resource_name: Optional[str] = Query(None, description="Filter results by resource name (supports partial matching)."),
+    image: Optional[str] = Query(None, description="Filter results by exact container image (e.g., nginx:1.25)."),
+    skip: int = Query(0, description="The number of records to skip for pagination."),
+    limit: int = Query(100, description="The maximum number of records to return."),
+):
+    """
+    Returns the summaries precomputed at collection time (replicas, images,
+    ports, ...) instead of the full resource documents.
+    """
+    return MongoJSONResponse(_query_resources(
+        collection=collection,
+        cluster_name=cluster_name,
+        namespace=namespace,
+        resource_type=resource_type,
+        resource_name=resource_name,
+        image=image,
+        skip=skip,
+        limit=limit,
+        projection=SUMMARY_PROJECTION,
+    ))
 
 @router.get("/api/resources/{resource_id}", response_model=ResourceOut, summary="Inspect a single resource")
 def get_resource(resource_id: str, collection: Collection = Depends(get_resource_collection)):
@@ -109,11 +257,70 @@ def get_resource(resource_id: str, collection: Collection = Depends(get_resource
     resource = collection.find_one({"_id": ObjectId(resource_id)})
 
     if resource:
-        resource["_id"] = str(resource["_id"])
-        return resource
+        return MongoJSONResponse(resource)
 
     raise HTTPException(status_code=404, detail="Resource not found.")
 
+@router.get("/api/resources/{resource_id}/history", response_model=AuditPageOut, summary="Get the change history of a resource")
+def get_resource_history(
+    resource_id: str,
+    since: Optional[datetime] = Query(None, description="Only include changes at or after this time (UTC)."),
+    until: Optional[datetime] = Query(None, description="Only include changes before this time (UTC)."),
+    cursor: Optional[str] = Query(None, description="The `next_cursor` of the previous page."),
+    limit: int = Query(50, ge=1, le=500, description="The maximum number of changes to return."),
+    include_diff: bool = Query(False, description="Include the full diff of each change instead of only the changed paths."),
+    collection: Collection = Depends(get_audit_log_collection),
+):
+    if not ObjectId.is_valid(resource_id):
+        raise HTTPException(status_code=400, detail="Invalid resource ID format.")
+
+    return MongoJSONResponse(_query_audit_logs(
+        collection=collection,
+        filters={"resource_id": resource_id},
+        since=since,
+        until=until,
+        cursor=cursor,
+        limit=limit,
+        include_diff=include_diff,
+    ))
+
+@router.get("/api/audit", response_model=AuditPageOut, summary="List resource changes across clusters")
+def get_audit_logs(
+    cluster_name: Optional[str] = Query(None, description="Filter changes by cluster name."),
+    namespace: Optional[str] = Query(None, description="Filter changes by namespace."),
+    resource_type: Optional[str] = Query(None, description="Filter changes by resource type (e.g., Deployment)."),
+    resource_name: Optional[str] = Query(None, description="Filter changes by exact resource name."),
+    since: Optional[datetime] = Query(None, description="Only include changes at or after this time (UTC)."),
+    until: Optional[datetime] = Query(None, description="Only include changes before this time (UTC)."),
+    cursor: Optional[str] = Query(None, description="The `next_cursor` of the previous page."),
+    limit: int = Query(50, ge=1, le=500, description="The maximum number of changes to return."),
+    include_diff: bool = Query(False, description="Include the full diff of each change instead of only the changed paths."),
+    collection: Collection = Depends(get_audit_log_collection),
+):
+    """
+    Answers questions like "what changed in prod in the last hour", newest
+    change first.
+    """
+    filters = {}
+    if cluster_name:
+        filters["cluster_name"] = cluster_name
+    if namespace:
+        filters["namespace"] = namespace
+    if resource_type:
+        filters["resource_type"] = resource_type
+    if resource_name:
+        filters["resource_name"] = resource_name
+
+    return MongoJSONResponse(_query_audit_logs(
+        collection=collection,
+        filters=filters,
+        since=since,
+        until=until,
+        cursor=cursor,
+        limit=limit,
+        include_diff=include_diff,
+    ))
+
 @router.get("/api/config", response_model=List[ClusterConfigOut], summary="Get cluster FQDN configurations")
 def get_cluster_config():
     """
@@ -122,6 +329,15 @@ def get_cluster_config():
     # Expose only non-sensitive information to the frontend
     return [{"name": c.get("name"), "fqdn": c.get("fqdn")} for c in CLUSTERS]
 
+@router.get("/api/collector/metrics", response_model=List[CollectorMetricsOut], summary="Get per-cluster API call metrics of the collector")
+def get_collector_metrics():
+    """
+    Returns the request, throttling, error and latency counters of the
+    collector's calls to each cluster since startup, along with the current
+    adaptive concurrency limit.
+    """
+    return throttle_registry.snapshots()
+
 @router.get("/api/related-namespaces", response_model=List[RelatedNamespaceOut], summary="Find all namespaces for a given resource name and type")
 def get_related_namespaces(
     resource_type: str = Query(..., description="The type of the resource (e.g., 'Service', 'Deployment')."),
@@ -172,4 +388,85 @@ def get_related_namespaces(
             detail=f"No namespaces found for resource name containing '{name}' of type '{resource_type}'"
         )
 
-    return results
\ No newline at end of file
+    return results
+
+@router.get("/api/drift", response_model=List[DriftReportOut], summary="Compare copies of resources across clusters")
+def get_drift(
+    resource_type: str = Query(..., description="The type of the resource (e.g., 'Deployment', 'ConfigMap')."),
+    name: Optional[str] = Query(None, description="Compare every copy of the resource with this exact name."),
+    namespace: Optional[str] = Query(None, description="Compare every resource of this type in the namespace."),
+    collection: Collection = Depends(get_resource_collection),
+):
+    """
+    Groups the copies of each resource by their normalized content digest.
+    Copies sharing a digest are identical; when a resource has more than one
+    variant, the most common one is used as the baseline and every other
+    variant carries its path-level diff against it.
+    """
+    if not name and not namespace:
+        raise HTTPException(status_code=400, detail="Either 'name' or 'namespace' must be provided.")
+
+    # Documents without a digest yet can't be compared, so they are left out
+    match = {"resource_type": resource_type, "content_digest": {"$ne": None}}
+    if name:
+        match["resource_name"] = name
+    if namespace:
+        match["namespace"] = namespace
+
+    pipeline = [
+        {"$match": match},
+        # One group per distinct content of each resource name
+        {"$group": {
+            "_id": {"resource_name": "$resource_name", "content_digest": "$content_digest"},
+            "copies": {"$push": {"_id": "$_id", "cluster_name": "$cluster_name", "namespace": "$namespace"}},
+            "count": {"$sum": 1},
+        }},
+        # Most common variant first, so it becomes the baseline
+        {"$sort": {"_id.resource_name": 1, "count": -1, "_id.content_digest": 1}},
+        {"$group": {
+            "_id": "$_id.resource_name",
+            "variants": {"$push": {"content_digest": "$_id.content_digest", "copies": "$copies"}},
+        }},
+        {"$sort": {"_id": 1}},
+    ]
+    groups = list(collection.aggregate(pipeline))
+
+    if not groups:
+        raise HTTPException(status_code=404, detail=f"No resources of type '{resource_type}' found to compare.")
+
+    # Only one representative document per drifting variant is needed for the diffs
+    representative_ids = [
+        variant["copies"][0]["_id"]
+        for group in groups if len(group["variants"]) > 1
+        for variant in group["variants"]
+    ]
+    representatives = {
+        doc["_id"]: normalize_resource(doc["data"], resource_type)
+        for doc in collection.find({"_id": {"$in": representative_ids}}, {"data": 1})
+    }
+
+    reports = []
+    for group in groups:
+        variants = group["variants"]
+        baseline = representatives.get(variants[0]["copies"][0]["_id"])
+        variants_out = []
+        for index, variant in enumerate(variants):
+            difference = None
+            if index > 0:
+                difference = get_diff(baseline, representatives[variant["copies"][0]["_id"]])
+            variants_out.append({
+                "content_digest": variant["content_digest"],
+                "copies": [
+                    {"id": str(c["_id"]), "cluster_name": c["cluster_name"], "namespace": c["namespace"]}
+                    for c in variant["copies"]
+                ],
+                "diff": difference,
+            })
+        reports.append({
+            "resource_type": resource_type,
+            "resource_name": group["_id"],
+            "identical": len(variants) == 1,
+            "variants": variants_out,
+        })
+
+    return reports
@@ -0,0 +1,24 @@
+from typing import Any
+import orjson
+from bson import ObjectId
+from fastapi.responses import Response
+
+def _bson_default(obj: Any) -> Any:
+    """Converts BSON types that orjson doesn't know about natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+class MongoJSONResponse(Response):
+    """
+    Serializes MongoDB documents straight to JSON with orjson.
+
+    Documents are validated by `models.resource.Resource` when they are
+    ingested, so returning this response from an endpoint skips FastAPI's
+    `response_model` validation and the stdlib encoder. ObjectIds become
+    strings and datetimes ISO 8601 strings, as with the Pydantic path.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_bson_default)
@@ -0,0 +1,92 @@
+"""
+Compares the CPU cost of serializing a page of `/api/resources` results
+through the Pydantic `ResourceOut` path against `MongoJSONResponse`.
+
+Usage (needs the same environment as the test suite):
+    python -m benchmarks.bench_responses [page_size] [repeats]
+"""
+import sys
+import time
+from datetime import datetime
+from typing import List
+from bson import ObjectId
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from api.endpoints import ResourceOut
+from api.responses import MongoJSONResponse
+
+def _make_document(index: int) -> dict:
+    """Builds a Deployment-like document with a realistically nested `data` blob."""
+    containers = [
+        {
+            "name": f"container-{c}",
+            "image": f"registry.example.com/app-{c}:1.{index}",
+            "ports": [{"containerPort": 8000 + p, "protocol": "TCP"} for p in range(3)],
+            "env": [{"name": f"ENV_{e}", "value": f"value-{e}-{index}"} for e in range(20)],
+            "resources": {"limits": {"cpu": "500m", "memory": "512Mi"}, "requests": {"cpu": "100m", "memory": "128Mi"}},
+        }
+        for c in range(3)
+    ]
+    data = {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {
+            "name": f"app-{index}",
+            "namespace": "default",
+            "labels": {f"label-{l}": f"value-{l}" for l in range(10)},
+            "annotations": {f"annotation-{a}": "x" * 200 for a in range(5)},
+        },
+        "spec": {"replicas": 3, "template": {"spec": {"containers": containers}}},
+        "status": {"readyReplicas": 3, "conditions": [{"type": "Available", "status": "True"}]},
+    }
+    return {
+        "_id": ObjectId(),
+        "cluster_name": "bench-cluster",
+        "namespace": "default",
+        "resource_type": "Deployment",
+        "resource_name": f"app-{index}",
+        "resource_version": str(index),
+        "data": data,
+        "full_resource_string": "",
+        "content_digest": None,
+        "summary": None,
+        "created_at": datetime.utcnow(),
+    }
+
+_adapter = TypeAdapter(List[ResourceOut])
+
+def legacy_render(documents: List[dict]) -> bytes:
+    """Mirrors the previous path: stringify ids, validate, dump with aliases, encode with json."""
+    for doc in documents:
+        doc["_id"] = str(doc["_id"])
+    validated = _adapter.validate_python(documents)
+    content = _adapter.dump_python(validated, mode="json", by_alias=True)
+    return JSONResponse(content).body
+
+def fast_render(documents: List[dict]) -> bytes:
+    return MongoJSONResponse(documents).body
+
+def _cpu_per_request(render, page_size: int, repeats: int) -> float:
+    total = 0.0
+    for _ in range(repeats):
+        documents = [_make_document(i) for i in range(page_size)]
+        start = time.process_time()
+        render(documents)
+        total += time.process_time() - start
+    return total / repeats * 1000
+
+def main():
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    legacy_ms = _cpu_per_request(legacy_render, page_size, repeats)
+    fast_ms = _cpu_per_request(fast_render, page_size, repeats)
+
+    print(f"Page size: {page_size}, repeats: {repeats}")
+    print(f"Pydantic + json:   {legacy_ms:8.2f} ms CPU per request")
+    print(f"MongoJSONResponse: {fast_ms:8.2f} ms CPU per request")
+    print(f"Speedup:           {legacy_ms / fast_ms:8.1f}x")
+
+if __name__ == "__main__":
+    main()
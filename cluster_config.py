@@ -8,6 +8,30 @@ CLUSTERS_CONFIG_PATH = os.environ.get(
     "clusters.yaml"  # Default to local file for easier development
 )
 
+def _read_token_file(path):
+    """Reads a token from a file, returning None if it can't be read."""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def get_token(cluster):
+    """
+    Returns the current token of a cluster. Tokens configured with
+    `token_file` are re-read on every call, so a token rotated by
+    `renew_token.sh` (or by the kubelet for mounted secrets) is picked up
+    without a restart. Environment tokens can't change while running.
+    """
+    token_file = cluster.get("token_file")
+    if token_file:
+        token = _read_token_file(token_file)
+        if token:
+            cluster["token"] = token
+        else:
+            print(f"Warning: Could not read token file {token_file}. Keeping the previous token.")
+    return cluster["token"]
+
 def load_clusters():
     """
     Loads cluster definitions from a YAML file and injects tokens and FQDNs
@@ -28,13 +52,19 @@ def load_clusters():
         raise ValueError(f"Invalid cluster config format in {CLUSTERS_CONFIG_PATH}")
 
     for cluster in clusters:
-        # Handle required token
+        # Handle required token, either from a file (which may be rotated) or the environment
+        token_file = cluster.get("token_file")
         token_env = cluster.get("token_env")
-        if not token_env:
-            raise ValueError(f"Cluster {cluster.get('name')} is missing 'token_env' field")
-        cluster["token"] = os.environ.get(token_env)
-        if not cluster["token"]:
-            raise RuntimeError(f"Token for {token_env} not found in environment variables")
+        if token_file:
+            cluster["token"] = _read_token_file(token_file)
+            if not cluster["token"]:
+                raise RuntimeError(f"Token file {token_file} for cluster {cluster.get('name')} is missing or empty")
+        else:
+            if not token_env:
+                raise ValueError(f"Cluster {cluster.get('name')} is missing 'token_env' or 'token_file' field")
+            cluster["token"] = os.environ.get(token_env)
+            if not cluster["token"]:
+                raise RuntimeError(f"Token for {token_env} not found in environment variables")
 
         # Handle optional FQDN
         fqdn_env = cluster.get("fqdn_env")
@@ -0,0 +1,62 @@
+import threading
+from kubernetes import client
+from cluster_config import get_token
+from utils.env import get_positive_int_env
+from utils.logger import logger
+
+# Number of API calls that may be in flight against a single cluster.
+# The connection pool of each cluster client is sized to match it.
+COLLECTION_CONCURRENCY = get_positive_int_env("COLLECTION_CONCURRENCY", 4)
+
+class ClusterClientRegistry:
+    """
+    Keeps one pooled `ApiClient` per cluster and reuses it across collection
+    cycles, so TLS sessions and keep-alive connections survive between runs.
+    A client is only rebuilt when the cluster's token changes.
+    """
+
+    def __init__(self, pool_size: int = COLLECTION_CONCURRENCY):
+        self.pool_size = pool_size
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, cluster: dict) -> client.ApiClient:
+        """Returns the shared client for a cluster, creating or rebuilding it if needed."""
+        cluster_name = cluster["name"]
+        token = get_token(cluster)
+
+        with self._lock:
+            cached = self._clients.get(cluster_name)
+            if cached and cached[0] == token:
+                return cached[1]
+
+            if cached:
+                logger.info(f"Token changed for cluster {cluster_name}, rebuilding API client.")
+                self._close_client(cached[1])
+
+            api_client = self._build_client(cluster, token)
+            self._clients[cluster_name] = (token, api_client)
+            return api_client
+
+    def close_all(self):
+        """Closes every cached client and its connection pool."""
+        with self._lock:
+            for _, api_client in self._clients.values():
+                self._close_client(api_client)
+            self._clients.clear()
+
+    def _build_client(self, cluster: dict, token: str) -> client.ApiClient:
+        configuration = client.Configuration()
+        configuration.host = cluster["api_server"]
+        configuration.verify_ssl = False
+        configuration.api_key = {"authorization": f"Bearer {token}"}
+        configuration.connection_pool_maxsize = self.pool_size
+        return client.ApiClient(configuration)
+
+    @staticmethod
+    def _close_client(api_client: client.ApiClient):
+        api_client.close()
+        api_client.rest_client.pool_manager.clear()
+
+# Process-wide registry used by the collector.
+client_registry = ClusterClientRegistry()
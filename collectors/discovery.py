@@ -0,0 +1,137 @@
+import threading
+import time
+from kubernetes.client import ApiClient, ApiException
+from utils.env import get_positive_int_env
+from utils.logger import logger
+
+# How long discovery results for a cluster are reused before the API is queried again.
+DISCOVERY_TTL_SECONDS = get_positive_int_env("DISCOVERY_TTL_SECONDS", 6 * 3600)
+
+# Groups skipped when a cluster is configured with `custom_resources: all`.
+# The first block is already collected through `RESOURCE_TYPES`, the second
+# contains objects that churn constantly and would flood the audit log.
+SKIPPED_DISCOVERY_GROUPS = {
+    "apps",
+    "batch",
+    "autoscaling",
+    "networking.k8s.io",
+    "apiextensions.k8s.io",
+    "events.k8s.io",
+    "metrics.k8s.io",
+    "coordination.k8s.io",
+    "discovery.k8s.io",
+}
+
+def _get_json(api_client: ApiClient, path: str, throttle=None) -> dict:
+    """
+    Performs an authenticated GET against a discovery endpoint and returns the
+    decoded body. Goes through the cluster's throttle when one is given.
+    """
+    call = throttle.call if throttle else lambda func, *args, **kwargs: func(*args, **kwargs)
+    return call(
+        api_client.call_api,
+        path,
+        "GET",
+        auth_settings=["BearerToken"],
+        response_type="object",
+        _return_http_data_only=True,
+    )
+
+def _parse_spec(entry: str) -> tuple:
+    """Splits a `group/version[/plural]` entry into its parts."""
+    parts = entry.strip("/").split("/")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid custom resource entry '{entry}', expected 'group/version[/plural]'")
+    group, version = parts[0], parts[1]
+    plural = parts[2] if len(parts) == 3 else None
+    return group, version, plural
+
+def _group_versions(api_client: ApiClient, spec, throttle=None) -> list:
+    """Resolves the configured spec into a list of (group, version, plural) to discover."""
+    if spec == "all":
+        groups = _get_json(api_client, "/apis", throttle).get("groups", [])
+        return [
+            (g["name"], g["preferredVersion"]["version"], None)
+            for g in groups
+            if g["name"] not in SKIPPED_DISCOVERY_GROUPS and g.get("preferredVersion")
+        ]
+    if isinstance(spec, str):
+        # A single `group/version[/plural]` entry given without a list
+        spec = [spec]
+    return [_parse_spec(entry) for entry in spec]
+
+def discover_custom_resource_types(api_client: ApiClient, cluster_name: str, spec, throttle=None) -> list:
+    """
+    Queries the API discovery endpoints for the configured group-versions and
+    returns resource type descriptors that can be listed via `CustomObjectsApi`.
+    """
+    resource_types = []
+    for group, version, plural in _group_versions(api_client, spec, throttle):
+        try:
+            resource_list = _get_json(api_client, f"/apis/{group}/{version}", throttle)
+        except ApiException as e:
+            logger.warning(f"Discovery of {group}/{version} failed on {cluster_name}: {e.reason}")
+            continue
+
+        for res in resource_list.get("resources", []):
+            # Skip subresources such as `routes/status` and anything we cannot list.
+            if "/" in res["name"] or "list" not in res.get("verbs", []):
+                continue
+            if plural and res["name"] != plural:
+                continue
+            resource_types.append({
+                # Qualified with the group, as kinds like Service or Ingress exist in several groups
+                "name": f"{res['kind']}.{group}",
+                "group": group,
+                "version": version,
+                "plural": res["name"],
+                "namespaced": res["namespaced"],
+            })
+
+    logger.info(f"Discovered {len(resource_types)} custom resource types on {cluster_name}.")
+    return resource_types
+
+class DiscoveryCache:
+    """Caches discovered custom resource types per cluster for a fixed TTL."""
+
+    def __init__(self, ttl_seconds: int = DISCOVERY_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, cluster: dict, api_client: ApiClient, throttle=None) -> list:
+        """Returns the custom resource types of a cluster, discovering them when the cache is stale."""
+        spec = cluster.get("custom_resources")
+        if not spec:
+            return []
+
+        cluster_name = cluster["name"]
+        spec_key = spec if isinstance(spec, str) else tuple(spec)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._entries.get(cluster_name)
+            if cached and cached[0] == spec_key and cached[1] > now:
+                return cached[2]
+
+        try:
+            resource_types = discover_custom_resource_types(api_client, cluster_name, spec, throttle)
+        except Exception as e:
+            # Don't cache a failed discovery (or an invalid spec) so one cluster can't break the cycle.
+            logger.error(f"Error discovering custom resources on {cluster_name}: {e}", exc_info=True)
+            return []
+
+        with self._lock:
+            self._entries[cluster_name] = (spec_key, now + self.ttl_seconds, resource_types)
+        return resource_types
+
+    def invalidate(self, cluster_name: str = None):
+        """Drops cached discovery results for one cluster, or for all clusters."""
+        with self._lock:
+            if cluster_name:
+                self._entries.pop(cluster_name, None)
+            else:
+                self._entries.clear()
+
+# Process-wide cache used by the collector.
+discovery_cache = DiscoveryCache()
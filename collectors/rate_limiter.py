@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from kubernetes.client import ApiException
+from urllib3.exceptions import MaxRetryError, NewConnectionError, TimeoutError as Urllib3TimeoutError
+from collectors.client_registry import COLLECTION_CONCURRENCY
+from utils.env import get_positive_float_env, get_positive_int_env
+from utils.logger import logger
+
+# Defaults for clusters that don't set `qps`/`burst` in clusters.yaml.
+DEFAULT_QPS = get_positive_float_env("COLLECTOR_QPS", 20)
+DEFAULT_BURST = get_positive_int_env("COLLECTOR_BURST", 40)
+# How many times a throttled or timed out call is retried before giving up.
+MAX_RETRIES = get_positive_int_env("COLLECTOR_MAX_RETRIES", 5)
+# Calls slower than this are treated as a sign of an overloaded control plane.
+LATENCY_THRESHOLD_SECONDS = get_positive_float_env("COLLECTOR_LATENCY_THRESHOLD_SECONDS", 5)
+
+# 429 is returned both for plain rate limiting and by API Priority and Fairness.
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_MAX_SECONDS = 60
+
+class TokenBucket:
+    """A thread-safe token bucket allowing `qps` calls per second with bursts up to `burst`."""
+
+    def __init__(self, qps: float, burst: int):
+        self.qps = qps
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes a token, then blocks until it has been earned. The count may go
+        negative, which reserves the token and makes later callers wait longer.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.qps)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.qps if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps the number of in-flight calls with an AIMD policy: the limit is halved
+    when a call is throttled, fails with a server error or is slow, and grows
+    by one after a full window of healthy calls, up to `max_limit`.
+    """
+
+    def __init__(self, max_limit: int, latency_threshold: float = LATENCY_THRESHOLD_SECONDS):
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.limit = max_limit
+        self._in_flight = 0
+        self._healthy_calls = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, overloaded: bool = False):
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or latency > self.latency_threshold:
+                self.limit = max(1, self.limit // 2)
+                self._healthy_calls = 0
+            else:
+                self._healthy_calls += 1
+                if self._healthy_calls >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._healthy_calls = 0
+            self._condition.notify_all()
+
+class ClusterThrottle:
+    """Rate limits, retries and measures the API calls made against a single cluster."""
+
+    def __init__(self, cluster_name: str, qps: float, burst: int, max_concurrency: int = COLLECTION_CONCURRENCY, max_retries: int = MAX_RETRIES):
+        self.cluster_name = cluster_name
+        self.bucket = TokenBucket(qps, burst)
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "errors": 0,
+            "retries": 0,
+            "latency_total": 0.0,
+            "max_latency_seconds": 0.0,
+        }
+
+    def call(self, func, *args, **kwargs):
+        """
+        Calls `func` once a rate limit token and a concurrency slot are
+        available. Throttled (429), server error and timed out calls are
+        retried with exponential backoff, honouring `Retry-After`.
+        """
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            self.bucket.acquire()
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                latency = time.monotonic() - start
+                retryable = _is_retryable(e)
+                self.limiter.release(latency, overloaded=retryable)
+                self._record(latency, error=e)
+                if not retryable or attempt == self.max_retries:
+                    raise
+
+                delay = _backoff_delay(attempt, e)
+                self._increment("retries")
+                logger.warning(
+                    f"API call to {self.cluster_name} was throttled or failed ({_describe(e)}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.max_retries})"
+                )
+                time.sleep(delay)
+            else:
+                latency = time.monotonic() - start
+                self.limiter.release(latency)
+                self._record(latency)
+                return result
+
+    def snapshot(self) -> dict:
+        """Returns the current metrics of this cluster."""
+        with self._lock:
+            stats = dict(self._stats)
+        requests = stats.pop("requests")
+        latency_total = stats.pop("latency_total")
+        return {
+            "cluster_name": self.cluster_name,
+            "requests": requests,
+            **stats,
+            "avg_latency_seconds": latency_total / requests if requests else 0.0,
+            "concurrency_limit": self.limiter.limit,
+            "qps": self.bucket.qps,
+            "burst": self.bucket.burst,
+        }
+
+    def _record(self, latency: float, error: Exception = None):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["latency_total"] += latency
+            self._stats["max_latency_seconds"] = max(self._stats["max_latency_seconds"], latency)
+            if isinstance(error, ApiException) and error.status == 429:
+                self._stats["throttled"] += 1
+            elif error is not None:
+                self._stats["errors"] += 1
+
+    def _increment(self, key: str):
+        with self._lock:
+            self._stats[key] += 1
+
+def _is_timeout(e: Exception) -> bool:
+    """
+    True for calls that timed out against a slow control plane. urllib3 makes
+    `NewConnectionError` (refused connections, DNS failures) a `TimeoutError`
+    subclass, but an unreachable cluster is not an overloaded one.
+    """
+    if isinstance(e, MaxRetryError):
+        e = e.reason
+    return isinstance(e, Urllib3TimeoutError) and not isinstance(e, NewConnectionError)
+
+def _is_retryable(e: Exception) -> bool:
+    if isinstance(e, ApiException):
+        return e.status in RETRYABLE_STATUSES
+    return _is_timeout(e)
+
+def _retry_after(e: Exception) -> float:
+    """Reads the `Retry-After` header (in seconds) of a failed call, if any."""
+    headers = getattr(e, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+def _backoff_delay(attempt: int, e: Exception) -> float:
+    """
+    Exponential backoff with jitter, never shorter than the server's
+    `Retry-After` but capped at `BACKOFF_MAX_SECONDS` so a worker is never
+    tied up for long.
+    """
+    backoff = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt)
+    backoff *= random.uniform(0.5, 1.0)
+    return min(BACKOFF_MAX_SECONDS, max(backoff, _retry_after(e)))
+
+def _describe(e: Exception) -> str:
+    if isinstance(e, ApiException):
+        return f"{e.status} {e.reason}"
+    return type(e).__name__
+
+def _cluster_setting(cluster: dict, key: str, default: float) -> float:
+    """Reads a positive number from a cluster's config, falling back to the default when invalid."""
+    value = cluster.get(key)
+    if value is None:
+        return default
+    try:
+        value = float(value)
+        if value <= 0:
+            raise ValueError(f"{key} must be positive.")
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid '{key}' for cluster {cluster['name']}. Defaulting to {default}.")
+        return default
+    return value
+
+class ThrottleRegistry:
+    """Keeps one throttle per cluster, so learned limits carry over between cycles."""
+
+    def __init__(self):
+        self._throttles = {}
+        self._lock = threading.Lock()
+
+    def get(self, cluster: dict) -> ClusterThrottle:
+        cluster_name = cluster["name"]
+        with self._lock:
+            throttle = self._throttles.get(cluster_name)
+            if not throttle:
+                throttle = ClusterThrottle(
+                    cluster_name,
+                    qps=_cluster_setting(cluster, "qps", DEFAULT_QPS),
+                    burst=int(_cluster_setting(cluster, "burst", DEFAULT_BURST)),
+                )
+                self._throttles[cluster_name] = throttle
+            return throttle
+
+    def snapshots(self) -> list:
+        """Returns the metrics of every cluster seen so far."""
+        with self._lock:
+            throttles = list(self._throttles.values())
+        return [throttle.snapshot() for throttle in throttles]
+
+# Process-wide registry used by the collector.
+throttle_registry = ThrottleRegistry()
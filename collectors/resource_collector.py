@@ -1,15 +1,24 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from kubernetes import client
-from kubernetes.client import ApiClient, ApiException
+from kubernetes.client import ApiException
 from cluster_config import CLUSTERS
+from collectors.client_registry import client_registry, COLLECTION_CONCURRENCY
+from collectors.discovery import discovery_cache
+from collectors.rate_limiter import throttle_registry
 from utils.db import get_resource_collection, get_audit_log_collection
 from utils.logger import logger
+from utils.diff import get_changed_paths
+from utils.digest import compute_digest
+from utils.presenter import build_summary
 from models.resource import Resource, AuditLog
 from jsondiff import diff
 
 # A comprehensive list of resources to collect.
 # `namespaced=True` for resources within a namespace.
 # `namespaced=False` for cluster-wide resources.
+# Custom resources discovered per cluster (see `collectors.discovery`) use the
+# same shape, with `group`/`version`/`plural` in place of `api`/`list_func`.
 RESOURCE_TYPES = [
     {"name": "Pod", "list_func": "list_namespaced_pod", "api": "CoreV1Api", "namespaced": True},
     {"name": "ConfigMap", "list_func": "list_namespaced_config_map", "api": "CoreV1Api", "namespaced": True},
@@ -33,11 +42,16 @@ def _process_and_store_resources(items, cluster_name, resource_type, namespace,
     for item in items:
         resource_dict = api_client.sanitize_for_serialization(item)
         full_resource_str = json.dumps(resource_dict)
+        content_digest = compute_digest(resource_dict, resource_type)
+        summary = build_summary(resource_type, resource_dict)
+        metadata = resource_dict.get("metadata", {})
+        resource_name = metadata.get("name")
+        resource_version = metadata.get("resourceVersion")
 
         query = {
             "cluster_name": cluster_name,
             "resource_type": resource_type,
-            "resource_name": item.metadata.name,
+            "resource_name": resource_name,
         }
         if namespace:
             query["namespace"] = namespace
@@ -45,107 +59,155 @@ def _process_and_store_resources(items, cluster_name, resource_type, namespace,
         existing_resource = collection.find_one(query)
 
         if existing_resource:
-            if existing_resource["resource_version"] != item.metadata.resource_version:
-                difference = diff(existing_resource["data"], resource_dict, syntax='symmetric')
+            if existing_resource["resource_version"] != resource_version:
+                # `marshal` turns jsondiff's insert/delete symbols into plain string keys
+                # ("__insert", "__delete"); MongoDB rejects the default "$" prefix.
+                difference = diff(existing_resource["data"], resource_dict, syntax='symmetric', marshal=True, escape_str="__")
                 serializable_diff = json.loads(json.dumps(difference))
                 audit_log = AuditLog(
                     resource_id=str(existing_resource["_id"]),
+                    cluster_name=cluster_name,
+                    namespace=namespace or "",
+                    resource_type=resource_type,
+                    resource_name=resource_name,
                     old_version=existing_resource["resource_version"],
-                    new_version=item.metadata.resource_version,
+                    new_version=resource_version,
                     diff=serializable_diff,
+                    changed_paths=get_changed_paths(existing_resource["data"], resource_dict),
                 )
                 audit_collection.insert_one(audit_log.model_dump())
 
                 collection.update_one(
                     {"_id": existing_resource["_id"]},
                     {"$set": {
-                        "resource_version": item.metadata.resource_version,
+                        "resource_version": resource_version,
                         "data": resource_dict,
                         "full_resource_string": full_resource_str,
+                        "content_digest": content_digest,
+                        "summary": summary,
                         "created_at": audit_log.changed_at
                     }}
                 )
-                logger.info(f"Updated {resource_type} '{item.metadata.name}'" + (f" in '{namespace}'" if namespace else ""))
+                logger.info(f"Updated {resource_type} '{resource_name}'" + (f" in '{namespace}'" if namespace else ""))
+            elif existing_resource.get("content_digest") != content_digest or existing_resource.get("summary") != summary:
+                # Backfill documents stored before digests and summaries existed, or after their rules changed.
+                collection.update_one(
+                    {"_id": existing_resource["_id"]},
+                    {"$set": {"content_digest": content_digest, "summary": summary}}
+                )
         else:
             new_resource = Resource(
                 cluster_name=cluster_name,
                 namespace=namespace or "",
                 resource_type=resource_type,
-                resource_name=item.metadata.name,
-                resource_version=item.metadata.resource_version,
+                resource_name=resource_name,
+                resource_version=resource_version,
                 data=resource_dict,
                 full_resource_string=full_resource_str,
+                content_digest=content_digest,
+                summary=summary,
             )
             collection.insert_one(new_resource.model_dump())
-            logger.info(f"Inserted new {resource_type} '{item.metadata.name}'" + (f" in '{namespace}'" if namespace else ""))
+            logger.info(f"Inserted new {resource_type} '{resource_name}'" + (f" in '{namespace}'" if namespace else ""))
+
+def _list_items(api_map, res_type, namespace):
+    """Lists the items of a resource type, either within a namespace or cluster-wide."""
+    if "plural" in res_type:
+        custom_api = api_map["CustomObjectsApi"]
+        if namespace:
+            response = custom_api.list_namespaced_custom_object(
+                res_type["group"], res_type["version"], namespace, res_type["plural"]
+            )
+        else:
+            response = custom_api.list_cluster_custom_object(
+                res_type["group"], res_type["version"], res_type["plural"]
+            )
+        return response.get("items", [])
+
+    list_func = getattr(api_map[res_type["api"]], res_type["list_func"])
+    resources = list_func(namespace=namespace) if namespace else list_func()
+    return resources.items
+
+def _collect_resource_type(res_type, namespace, cluster_name, api_map, api_client, throttle, resource_collection, audit_log_collection):
+    """Collects a single resource type in a namespace (or cluster-wide) and stores the results."""
+    location = namespace or cluster_name
+    try:
+        items = throttle.call(_list_items, api_map, res_type, namespace)
+        if namespace:
+            if items:
+                logger.debug(f"Found {len(items)} {res_type['name']} resources in {namespace}.")
+        else:
+            logger.info(f"Found {len(items)} {res_type['name']} resources in {cluster_name}.")
+        _process_and_store_resources(items, cluster_name, res_type["name"], namespace, resource_collection, audit_log_collection, api_client)
+    except ApiException as e:
+        # Log 403 (Forbidden) as a warning, others as errors
+        if e.status == 403:
+            logger.warning(f"Permission denied fetching {res_type['name']} from {location}: {e.reason}")
+        else:
+            logger.error(f"API Error fetching {res_type['name']} from {location}: {e.reason}", exc_info=True)
+    except Exception as e:
+        logger.error(f"An unexpected error occurred fetching {res_type['name']} in {location}: {e}", exc_info=True)
 
 def collect_resources():
     """Collects various Kubernetes resources from configured clusters and stores them in MongoDB."""
     logger.info("Starting resource collection cycle...")
     resource_collection = get_resource_collection()
     audit_log_collection = get_audit_log_collection()
-    api_client = ApiClient()
 
     for cluster in CLUSTERS:
         cluster_name = cluster["name"]
         logger.info(f"Starting collection for cluster: {cluster_name}")
 
-        configuration = client.Configuration()
-        configuration.host = cluster["api_server"]
-        configuration.verify_ssl = False
-        configuration.api_key = {"authorization": f"Bearer {cluster['token']}"}
+        # All API groups share the cluster's pooled client, which is reused across cycles.
+        api_client = client_registry.get(cluster)
 
         api_map = {
-            "CoreV1Api": client.CoreV1Api(client.ApiClient(configuration)),
-            "AppsV1Api": client.AppsV1Api(client.ApiClient(configuration)),
-            "BatchV1Api": client.BatchV1Api(client.ApiClient(configuration)),
-            "NetworkingV1Api": client.NetworkingV1Api(client.ApiClient(configuration)),
-            "AutoscalingV1Api": client.AutoscalingV1Api(client.ApiClient(configuration)),
-            "ApiextensionsV1Api": client.ApiextensionsV1Api(client.ApiClient(configuration)),
+            "CoreV1Api": client.CoreV1Api(api_client),
+            "AppsV1Api": client.AppsV1Api(api_client),
+            "BatchV1Api": client.BatchV1Api(api_client),
+            "NetworkingV1Api": client.NetworkingV1Api(api_client),
+            "AutoscalingV1Api": client.AutoscalingV1Api(api_client),
+            "ApiextensionsV1Api": client.ApiextensionsV1Api(api_client),
+            "CustomObjectsApi": client.CustomObjectsApi(api_client),
         }
 
-        # Handle cluster-scoped resources
-        logger.info(f"Processing cluster-scoped resources for {cluster_name}...")
-        for res_type in filter(lambda r: not r["namespaced"], RESOURCE_TYPES):
-            try:
-                api_instance = api_map[res_type["api"]]
-                list_func = getattr(api_instance, res_type["list_func"])
-                resources = list_func()
-                logger.info(f"Found {len(resources.items)} {res_type['name']} resources in {cluster_name}.")
-                _process_and_store_resources(resources.items, cluster_name, res_type["name"], None, resource_collection, audit_log_collection, api_client)
-            except ApiException as e:
-                logger.error(f"Error fetching {res_type['name']} from {cluster_name}: {e.reason}", exc_info=True)
-            except Exception as e:
-                logger.error(f"An unexpected error occurred fetching {res_type['name']}: {e}", exc_info=True)
-
-        # Handle namespaced resources
+        # Every API call to the cluster goes through its throttle (rate limit, backoff, adaptive concurrency)
+        throttle = throttle_registry.get(cluster)
+
+        resource_types = RESOURCE_TYPES + discovery_cache.get(cluster, api_client, throttle)
+
+        # Cluster-scoped resources are listed once per cluster
+        tasks = [(res_type, None) for res_type in resource_types if not res_type["namespaced"]]
+
+        # Namespaced resources are listed once per matching namespace
         try:
             namespace_label_selector = cluster.get("namespace_label_selector", "")
             logger.info(f"Fetching namespaces from {cluster_name} with selector: '{namespace_label_selector or 'None'}'")
-            namespaces = api_map["CoreV1Api"].list_namespace(label_selector=namespace_label_selector)
+            namespaces = throttle.call(api_map["CoreV1Api"].list_namespace, label_selector=namespace_label_selector)
             logger.info(f"Found {len(namespaces.items)} namespaces to scan.")
+            tasks.extend(
+                (res_type, ns.metadata.name)
+                for ns in namespaces.items
+                for res_type in resource_types
+                if res_type["namespaced"]
+            )
         except ApiException as e:
             logger.error(f"Error fetching namespaces from {cluster_name}: {e.reason}", exc_info=True)
-            continue
-
-        for ns in namespaces.items:
-            namespace_name = ns.metadata.name
-            logger.debug(f"Scanning namespace: {namespace_name}")
-            for res_type in filter(lambda r: r["namespaced"], RESOURCE_TYPES):
-                try:
-                    api_instance = api_map[res_type["api"]]
-                    list_func = getattr(api_instance, res_type["list_func"])
-                    resources = list_func(namespace=namespace_name)
-                    if resources.items:
-                        logger.debug(f"Found {len(resources.items)} {res_type['name']} resources in {namespace_name}.")
-                    _process_and_store_resources(resources.items, cluster_name, res_type["name"], namespace_name, resource_collection, audit_log_collection, api_client)
-                except ApiException as e:
-                    # Log 403 (Forbidden) as a warning, others as errors
-                    if e.status == 403:
-                        logger.warning(f"Permission denied fetching {res_type['name']} from {namespace_name}: {e.reason}")
-                    else:
-                        logger.error(f"API Error fetching {res_type['name']} from {namespace_name}: {e.reason}", exc_info=True)
-                except Exception as e:
-                    logger.error(f"An unexpected error occurred fetching {res_type['name']} in {namespace_name}: {e}", exc_info=True)
+
+        logger.info(f"Collecting {len(tasks)} resource lists from {cluster_name} with concurrency {COLLECTION_CONCURRENCY}.")
+        with ThreadPoolExecutor(max_workers=COLLECTION_CONCURRENCY) as executor:
+            for res_type, namespace in tasks:
+                executor.submit(
+                    _collect_resource_type,
+                    res_type, namespace, cluster_name, api_map, api_client, throttle,
+                    resource_collection, audit_log_collection,
+                )
+
+        metrics = throttle.snapshot()
+        logger.info(
+            f"API metrics for {cluster_name} since startup: {metrics['requests']} requests, {metrics['throttled']} throttled, "
+            f"{metrics['errors']} errors, {metrics['retries']} retries, "
+            f"avg latency {metrics['avg_latency_seconds']:.2f}s, concurrency limit {metrics['concurrency_limit']}"
+        )
 
     logger.info("Resource collection cycle complete.")
\ No newline at end of file
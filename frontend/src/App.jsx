@@ -216,9 +216,22 @@ const StandardSummary = ({ data, fullResourceString, keyword }) => {
 
 const ResourceCard = ({ resource, keyword, clusterConfigs }) => {
   const [activeTab, setActiveTab] = useState('summary');
-  const summaryData = presentResource(resource);
+  // Listings without a keyword come from /api/summaries, so the full document is only fetched when needed
+  const [fullResource, setFullResource] = useState(resource.data ? resource : null);
+  const needsFullResource = activeTab === 'raw' || !resource.summary;
+
+  useEffect(() => {
+    if (fullResource || !needsFullResource) {
+      return;
+    }
+    axios.get(`/api/resources/${resource._id}`)
+      .then(response => setFullResource(response.data))
+      .catch(err => console.error("Failed to load resource", err));
+  }, [fullResource, needsFullResource, resource._id]);
+
+  const summaryData = fullResource ? presentResource(fullResource) : (resource.summary || {});
   const isConfigMap = resource.resource_type?.toLowerCase() === 'configmap';
-  const fullResourceString = JSON.stringify(resource.data, null, 2);
+  const fullResourceString = fullResource ? JSON.stringify(fullResource.data, null, 2) : 'Loading...';
   const resourceLink = generateLink(resource, clusterConfigs);
 
   const resourceTitle = resourceLink ? (
@@ -265,7 +278,7 @@ const Results = ({ results, keyword, hasSearched, clusterConfigs }) => {
   }
   return (
     <div className="results-container">
-      {results.map(res => <ResourceCard key={res.id} resource={res} keyword={keyword} clusterConfigs={clusterConfigs} />)}
+      {results.map(res => <ResourceCard key={res._id} resource={res} keyword={keyword} clusterConfigs={clusterConfigs} />)}
     </div>
   );
 };
@@ -307,7 +320,9 @@ function App() {
     setHasSearched(true);
     setSearchKeyword(params.keyword);
     try {
-      const response = await axios.get('/api/resources', { params });
+      // Keyword searches need the full documents for match snippets; plain listings only need summaries
+      const endpoint = params.keyword ? '/api/resources' : '/api/summaries';
+      const response = await axios.get(endpoint, { params });
       setResults(response.data);
     } catch (err) {
       setError('Failed to fetch results. Please try again.');
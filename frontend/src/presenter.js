@@ -125,6 +125,7 @@ function presentStatefulSet(data) {
         "Replicas": `${data.status?.readyReplicas || 0} / ${spec.replicas || 0}`,
         "Service Name": spec.serviceName,
         "Update Strategy": spec.updateStrategy?.type,
+        "Containers": (spec.template?.spec?.containers || []).map(c => ({ Name: c.name, Image: c.image })),
     };
 }
 
@@ -144,6 +145,7 @@ function presentJob(data) {
         "Parallelism": data.spec?.parallelism,
         "Succeeded": data.status?.succeeded,
         "Failed": data.status?.failed,
+        "Containers": (data.spec?.template?.spec?.containers || []).map(c => ({ Name: c.name, Image: c.image })),
     };
 }
 
@@ -158,10 +160,11 @@ function presentCronJob(data) {
 function presentHPA(data) {
     const spec = data.spec || {};
     return {
-        "Scale Target": `${spec.scaleTargetRef.kind}/${spec.scaleTargetRef.name}`,
+        "Scale Target": `${spec.scaleTargetRef?.kind}/${spec.scaleTargetRef?.name}`,
         "Min Replicas": spec.minReplicas,
         "Max Replicas": spec.maxReplicas,
         "Current Replicas": data.status?.currentReplicas,
+        "Target CPU Utilization": spec.targetCPUUtilizationPercentage,
     };
 }
 
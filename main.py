@@ -4,8 +4,9 @@ from fastapi.staticfiles import StaticFiles
 from api import endpoints
 from scheduler.scheduler import start_scheduler
 from collectors.resource_collector import collect_resources
+from collectors.client_registry import client_registry
 from utils.logger import logger
-from utils.db import client as db_client # Import client to trigger connection check
+from utils.db import client as db_client, ensure_indexes # Import client to trigger connection check
 import uvicorn
 
 @asynccontextmanager
@@ -18,6 +19,7 @@ async def lifespan(app: FastAPI):
 
     # The database connection is implicitly checked by the import above.
     # If the connection fails, the app will not start.
+    ensure_indexes()
 
     # Perform an initial collection on startup
     logger.info("Performing initial resource collection...")
@@ -33,6 +35,7 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Application shutting down...")
+    client_registry.close_all()
 
 app = FastAPI(
     title="Odin - OKD Resource Collector and Inspector",
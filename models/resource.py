@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 class Resource(BaseModel):
@@ -10,6 +10,8 @@ class Resource(BaseModel):
     resource_version: str = Field(..., description="The resource version from Kubernetes metadata.")
     data: Dict[str, Any] = Field(..., description="The full JSON representation of the resource.")
     full_resource_string: str = Field(description="The stringified full resource for searching.")
+    content_digest: Optional[str] = Field(None, description="Digest of the normalized resource content, used to detect drift between copies.")
+    summary: Optional[Dict[str, Any]] = Field(None, description="The presenter summary (replicas, images, ports, ...) computed at ingestion time.")
     created_at: datetime = Field(default_factory=datetime.utcnow, description="The timestamp when the resource was stored.")
 
     class Config:
@@ -17,9 +19,14 @@ class Resource(BaseModel):
 
 class AuditLog(BaseModel):
     resource_id: str = Field(..., description="The ID of the resource that was changed.")
+    cluster_name: str = Field(..., description="The cluster of the changed resource, denormalized for scoped queries.")
+    namespace: str = Field(..., description="The namespace of the changed resource, denormalized for scoped queries.")
+    resource_type: str = Field(..., description="The type of the changed resource, denormalized for scoped queries.")
+    resource_name: str = Field(..., description="The name of the changed resource, denormalized for scoped queries.")
     old_version: Optional[str] = Field(None, description="The previous resource version.")
     new_version: str = Field(..., description="The new resource version.")
     diff: Dict[str, Any] = Field(..., description="The diff between the old and new resource data.")
+    changed_paths: List[str] = Field(default_factory=list, description="The dotted paths that changed, as a compact summary of the diff.")
     changed_at: datetime = Field(default_factory=datetime.utcnow, description="The timestamp of the change.")
 
     class Config:
@@ -4,6 +4,11 @@ import subprocess
 import os
 
 def renew_token():
+    """
+    Runs the token renewal script. The script should write the new token to
+    the cluster's `token_file`; the collector re-reads it before each cycle
+    and rebuilds the cluster's API client when it changed.
+    """
     # This script's path might need adjustment depending on your project structure
     script_path = '/app/renew_token.sh'
     if os.path.exists(script_path):
@@ -38,6 +38,7 @@ resources_to_insert = [
         "resource_name": "my-deployment",
         "resource_version": "3",
         "data": {"replicas": 3},
+        "summary": {"Replicas": 3, "Containers": [{"Image": "nginx:1.25", "Ports": [80]}]},
     },
 ]
 
@@ -106,6 +107,18 @@ def test_search_resources(client):
     assert len(response.json()) == 1
     assert response.json()[0]["resource_name"] == "my-deployment"
 
+def test_filter_resources_by_image(client):
+    response = client.get("/api/resources?image=nginx:1.25")
+    assert response.status_code == 200
+    assert [r["resource_name"] for r in response.json()] == ["my-deployment"]
+
+def test_list_summaries(client):
+    response = client.get("/api/summaries?resource_type=Deployment")
+    assert response.status_code == 200
+    summary = response.json()[0]
+    assert summary["summary"]["Replicas"] == 3
+    assert "data" not in summary
+
 def test_get_filters(client):
     response = client.get("/filters/cluster_names")
     assert response.status_code == 200
@@ -0,0 +1,84 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from mongomock import MongoClient
+from bson import ObjectId
+from main import app
+from utils.db import get_audit_log_collection
+from utils.diff import get_changed_paths
+
+db = MongoClient().odin_audit
+
+RESOURCE_ID = "60d5f3f7e4b0c8b4b8b4b8c1"
+start = datetime(2024, 1, 1, 12, 0, 0)
+
+# Five changes to one Deployment in prod, one change to a ConfigMap in staging
+for i in range(5):
+    db.audit_logs.insert_one({
+        "_id": ObjectId(),
+        "resource_id": RESOURCE_ID,
+        "cluster_name": "prod",
+        "namespace": "default",
+        "resource_type": "Deployment",
+        "resource_name": "web",
+        "old_version": str(i),
+        "new_version": str(i + 1),
+        "diff": {"spec": {"replicas": [i, i + 1]}},
+        "changed_paths": ["spec.replicas"],
+        "changed_at": start + timedelta(minutes=10 * i),
+    })
+db.audit_logs.insert_one({
+    "_id": ObjectId(),
+    "resource_id": "60d5f3f7e4b0c8b4b8b4b8c2",
+    "cluster_name": "staging",
+    "namespace": "default",
+    "resource_type": "ConfigMap",
+    "resource_name": "settings",
+    "old_version": "1",
+    "new_version": "2",
+    "diff": {"data": {"key": ["a", "b"]}},
+    "changed_paths": ["data.key"],
+    "changed_at": start,
+})
+
+@pytest.fixture(scope="module")
+def client():
+    app.dependency_overrides[get_audit_log_collection] = lambda: db.audit_logs
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.pop(get_audit_log_collection, None)
+
+def test_get_changed_paths():
+    old = {"metadata": {"labels": {"a": "1"}}, "spec": {"replicas": 1}}
+    new = {"metadata": {"labels": {"a": "2", "b": "1"}}, "spec": {"replicas": 1}}
+    assert get_changed_paths(old, new) == ["metadata.labels.a", "metadata.labels.b"]
+
+def test_resource_history_is_paginated_newest_first(client):
+    response = client.get(f"/api/resources/{RESOURCE_ID}/history?limit=3")
+    assert response.status_code == 200
+    page = response.json()
+    assert [item["new_version"] for item in page["items"]] == ["5", "4", "3"]
+    assert "diff" not in page["items"][0]
+    assert page["next_cursor"]
+
+    response = client.get(f"/api/resources/{RESOURCE_ID}/history", params={"limit": 3, "cursor": page["next_cursor"]})
+    page = response.json()
+    assert [item["new_version"] for item in page["items"]] == ["2", "1"]
+    assert page["next_cursor"] is None
+
+def test_resource_history_with_diff(client):
+    response = client.get(f"/api/resources/{RESOURCE_ID}/history?limit=1&include_diff=true")
+    assert response.json()["items"][0]["diff"] == {"spec": {"replicas": [4, 5]}}
+
+def test_audit_scoped_to_cluster_and_time_range(client):
+    since = (start + timedelta(minutes=15)).isoformat()
+    response = client.get("/api/audit", params={"cluster_name": "prod", "since": since})
+    assert response.status_code == 200
+    assert [item["new_version"] for item in response.json()["items"]] == ["5", "4", "3"]
+
+    response = client.get("/api/audit?resource_type=ConfigMap")
+    assert [item["resource_name"] for item in response.json()["items"]] == ["settings"]
+
+def test_audit_rejects_invalid_cursor(client):
+    response = client.get("/api/audit?cursor=not-a-cursor")
+    assert response.status_code == 400
@@ -0,0 +1,35 @@
+from collectors.client_registry import ClusterClientRegistry
+
+def _cluster(token="token-a"):
+    return {"name": "test-cluster", "api_server": "https://api.test-cluster:6443", "token": token}
+
+def test_client_is_reused_across_calls():
+    registry = ClusterClientRegistry(pool_size=8)
+    first = registry.get(_cluster())
+    second = registry.get(_cluster())
+    assert first is second
+    assert first.configuration.connection_pool_maxsize == 8
+    registry.close_all()
+
+def test_client_is_rebuilt_when_token_changes():
+    registry = ClusterClientRegistry()
+    first = registry.get(_cluster("token-a"))
+    second = registry.get(_cluster("token-b"))
+    assert first is not second
+    assert second.configuration.api_key["authorization"] == "Bearer token-b"
+    registry.close_all()
+
+def test_client_is_rebuilt_when_token_file_is_rotated(tmp_path):
+    token_file = tmp_path / "token"
+    token_file.write_text("token-a\n")
+    cluster = {"name": "test-cluster", "api_server": "https://api.test-cluster:6443", "token": "token-a", "token_file": str(token_file)}
+
+    registry = ClusterClientRegistry()
+    first = registry.get(cluster)
+    assert registry.get(cluster) is first
+
+    token_file.write_text("token-b\n")
+    second = registry.get(cluster)
+    assert second is not first
+    assert second.configuration.api_key["authorization"] == "Bearer token-b"
+    registry.close_all()
@@ -0,0 +1,82 @@
+from collectors.discovery import DiscoveryCache, discover_custom_resource_types
+
+class FakeApiClient:
+    """Answers discovery requests from canned responses and counts the calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.responses = {
+            "/apis": {"groups": [
+                {"name": "apps", "preferredVersion": {"version": "v1"}},
+                {"name": "route.openshift.io", "preferredVersion": {"version": "v1"}},
+            ]},
+            "/apis/route.openshift.io/v1": {"resources": [
+                {"name": "routes", "kind": "Route", "namespaced": True, "verbs": ["get", "list", "watch"]},
+                {"name": "routes/status", "kind": "Route", "namespaced": True, "verbs": ["get", "patch"]},
+            ]},
+            "/apis/config.openshift.io/v1": {"resources": [
+                {"name": "ingresses", "kind": "Ingress", "namespaced": False, "verbs": ["list"]},
+            ]},
+            "/apis/operator.openshift.io/v1": {"resources": [
+                {"name": "ingresscontrollers", "kind": "IngressController", "namespaced": True, "verbs": ["list"]},
+                {"name": "dnses", "kind": "DNS", "namespaced": False, "verbs": ["list"]},
+            ]},
+            "/apis/config.openshift.io/v2": {"resources": [
+                {"name": "dnses", "kind": "DNS", "namespaced": False, "verbs": ["list"]},
+            ]},
+            "/apis/cert-manager.io/v1": {"resources": [
+                {"name": "certificates", "kind": "Certificate", "namespaced": True, "verbs": ["list"]},
+                {"name": "clusterissuers", "kind": "ClusterIssuer", "namespaced": False, "verbs": ["list"]},
+            ]},
+        }
+
+    def call_api(self, path, method, **kwargs):
+        self.calls.append(path)
+        return self.responses[path]
+
+def test_discover_all_skips_builtin_groups_and_subresources():
+    api_client = FakeApiClient()
+    types = discover_custom_resource_types(api_client, "test-cluster", "all")
+    assert types == [{
+        "name": "Route.route.openshift.io", "group": "route.openshift.io", "version": "v1",
+        "plural": "routes", "namespaced": True,
+    }]
+    assert "/apis/apps/v1" not in api_client.calls
+
+def test_discover_configured_group_version_and_plural():
+    api_client = FakeApiClient()
+    types = discover_custom_resource_types(api_client, "test-cluster", ["cert-manager.io/v1/clusterissuers"])
+    assert [t["name"] for t in types] == ["ClusterIssuer.cert-manager.io"]
+    assert types[0]["namespaced"] is False
+
+def test_discovery_is_cached_per_cluster():
+    api_client = FakeApiClient()
+    cache = DiscoveryCache(ttl_seconds=3600)
+    cluster = {"name": "test-cluster", "custom_resources": ["cert-manager.io/v1"]}
+    first = cache.get(cluster, api_client)
+    second = cache.get(cluster, api_client)
+    assert first == second
+    assert len(first) == 2
+    assert api_client.calls == ["/apis/cert-manager.io/v1"]
+
+def test_discovery_disabled_without_config():
+    api_client = FakeApiClient()
+    assert DiscoveryCache().get({"name": "test-cluster"}, api_client) == []
+    assert api_client.calls == []
+
+def test_same_kind_in_different_groups_gets_distinct_types():
+    api_client = FakeApiClient()
+    types = discover_custom_resource_types(
+        api_client, "test-cluster", ["config.openshift.io/v2/dnses", "operator.openshift.io/v1/dnses", "config.openshift.io/v1"]
+    )
+    assert [t["name"] for t in types] == ["DNS.config.openshift.io", "DNS.operator.openshift.io", "Ingress.config.openshift.io"]
+
+def test_single_string_spec_is_accepted():
+    api_client = FakeApiClient()
+    cache = DiscoveryCache()
+    types = cache.get({"name": "test-cluster", "custom_resources": "cert-manager.io/v1"}, api_client)
+    assert len(types) == 2
+
+def test_invalid_spec_does_not_raise():
+    api_client = FakeApiClient()
+    assert DiscoveryCache().get({"name": "test-cluster", "custom_resources": ["cert-manager.io"]}, api_client) == []
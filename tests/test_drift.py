@@ -0,0 +1,110 @@
+import pytest
+from fastapi.testclient import TestClient
+from mongomock import MongoClient
+from bson import ObjectId
+from main import app
+from utils.db import get_resource_collection
+from utils.digest import compute_digest
+
+db = MongoClient().odin_drift
+
+def _deployment(cluster_name, namespace, image, uid):
+    return {
+        "metadata": {"name": "web", "namespace": namespace, "uid": uid, "resourceVersion": uid},
+        "spec": {"replicas": 2, "template": {"spec": {"containers": [{"name": "web", "image": image}]}}},
+        "status": {"readyReplicas": 2},
+    }
+
+copies = [
+    ("test-cluster-1", "default", "web:1.0", "a"),
+    ("test-cluster-2", "default", "web:1.0", "b"),
+    ("test-cluster-3", "staging", "web:1.1", "c"),
+]
+for cluster_name, namespace, image, uid in copies:
+    data = _deployment(cluster_name, namespace, image, uid)
+    db.resources.insert_one({
+        "_id": ObjectId(),
+        "cluster_name": cluster_name,
+        "namespace": namespace,
+        "resource_type": "Deployment",
+        "resource_name": "web",
+        "resource_version": uid,
+        "data": data,
+        "full_resource_string": "",
+        "content_digest": compute_digest(data),
+    })
+
+def _service(cluster_ip):
+    return {
+        "metadata": {"name": "web", "namespace": "default"},
+        "spec": {"clusterIP": cluster_ip, "clusterIPs": [cluster_ip], "ports": [{"port": 80}], "selector": {"app": "web"}},
+    }
+
+for cluster_name, cluster_ip in [("test-cluster-1", "10.0.0.1"), ("test-cluster-2", "10.1.0.7")]:
+    data = _service(cluster_ip)
+    db.resources.insert_one({
+        "_id": ObjectId(),
+        "cluster_name": cluster_name,
+        "namespace": "default",
+        "resource_type": "Service",
+        "resource_name": "web",
+        "resource_version": "1",
+        "data": data,
+        "full_resource_string": "",
+        "content_digest": compute_digest(data, "Service"),
+    })
+
+# Stored before digests existed; must not be reported as identical to anything
+db.resources.insert_one({
+    "_id": ObjectId(),
+    "cluster_name": "test-cluster-3",
+    "namespace": "default",
+    "resource_type": "Service",
+    "resource_name": "web",
+    "resource_version": "1",
+    "data": _service("10.2.0.1"),
+    "full_resource_string": "",
+})
+
+@pytest.fixture(scope="module")
+def client():
+    previous = app.dependency_overrides.get(get_resource_collection)
+    app.dependency_overrides[get_resource_collection] = lambda: db.resources
+    with TestClient(app) as c:
+        yield c
+    if previous:
+        app.dependency_overrides[get_resource_collection] = previous
+
+def test_digest_ignores_server_assigned_fields():
+    first = _deployment("test-cluster-1", "default", "web:1.0", "a")
+    second = _deployment("test-cluster-2", "prod", "web:1.0", "b")
+    second["status"] = {"readyReplicas": 0}
+    assert compute_digest(first) == compute_digest(second)
+
+def test_drift_by_name(client):
+    response = client.get("/api/drift?resource_type=Deployment&name=web")
+    assert response.status_code == 200
+    report = response.json()[0]
+    assert report["identical"] is False
+
+    baseline, drifted = report["variants"]
+    assert {c["cluster_name"] for c in baseline["copies"]} == {"test-cluster-1", "test-cluster-2"}
+    assert baseline["diff"] is None
+    assert drifted["copies"][0]["cluster_name"] == "test-cluster-3"
+    assert "spec.template.spec.containers" in drifted["diff"]["modified"]
+
+def test_drift_by_namespace(client):
+    response = client.get("/api/drift?resource_type=Deployment&namespace=default")
+    assert response.status_code == 200
+    assert response.json()[0]["identical"] is True
+
+def test_drift_requires_name_or_namespace(client):
+    response = client.get("/api/drift?resource_type=Deployment")
+    assert response.status_code == 400
+
+def test_services_ignore_assigned_cluster_ips(client):
+    response = client.get("/api/drift?resource_type=Service&name=web")
+    assert response.status_code == 200
+    report = response.json()[0]
+    assert report["identical"] is True
+    assert {c["cluster_name"] for c in report["variants"][0]["copies"]} == {"test-cluster-1", "test-cluster-2"}
@@ -0,0 +1,20 @@
+from utils.presenter import build_summary
+
+def test_build_summary_for_pod():
+    data = {
+        "spec": {"nodeName": "node-1", "containers": [{"name": "app", "image": "app:1.0"}]},
+        "status": {"phase": "Running", "containerStatuses": [{"name": "app", "ready": True}]},
+    }
+    summary = build_summary("Pod", data)
+    assert summary["Status"] == "Running"
+    assert summary["Containers"] == [{"Name": "app", "Image": "app:1.0", "Ready": True}]
+
+def test_build_summary_for_statefulset_lists_images():
+    data = {"spec": {"replicas": 2, "template": {"spec": {"containers": [{"image": "db:15", "ports": [{"containerPort": 5432}]}]}}}}
+    summary = build_summary("StatefulSet", data)
+    assert summary["Replicas"] == 2
+    assert summary["Containers"] == [{"Image": "db:15", "Ports": [5432]}]
+
+def test_build_summary_skips_unsupported_types():
+    assert build_summary("ConfigMap", {"data": {"key": "value"}}) is None
+    assert build_summary("DaemonSet", {"spec": {}}) is None
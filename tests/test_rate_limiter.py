@@ -0,0 +1,118 @@
+import pytest
+from fastapi.testclient import TestClient
+from kubernetes.client import ApiException
+from main import app
+from collectors import rate_limiter
+from collectors.rate_limiter import AdaptiveConcurrencyLimiter, ClusterThrottle, ThrottleRegistry, TokenBucket
+
+def _throttled(retry_after=None):
+    e = ApiException(status=429, reason="Too Many Requests")
+    e.headers = {"Retry-After": retry_after} if retry_after else {}
+    return e
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records backoff sleeps instead of waiting."""
+    recorded = []
+    monkeypatch.setattr(rate_limiter.time, "sleep", recorded.append)
+    return recorded
+
+def test_token_bucket_allows_burst_then_waits(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+
+    bucket = TokenBucket(qps=10, burst=2)
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    # Each further token is reserved up front and waited for exactly once
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == [pytest.approx(0.1), pytest.approx(0.1)]
+
+def test_limiter_halves_on_overload_and_recovers():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, latency_threshold=5)
+    limiter.acquire()
+    limiter.release(latency=0.1, overloaded=True)
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(latency=10)
+    assert limiter.limit == 2
+    for _ in range(2):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.limit == 3
+
+def test_call_retries_throttled_requests_honouring_retry_after(sleeps):
+    throttle = ClusterThrottle("test-cluster", qps=1000, burst=1000, max_concurrency=4, max_retries=3)
+    responses = [_throttled("7"), _throttled(), "ok"]
+
+    def list_func():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert throttle.call(list_func) == "ok"
+    assert sleeps[0] == 7
+    assert 1 <= sleeps[1] <= 2
+
+    metrics = throttle.snapshot()
+    assert metrics["requests"] == 3
+    assert metrics["throttled"] == 2
+    assert metrics["retries"] == 2
+    assert metrics["concurrency_limit"] < 4
+
+def test_call_does_not_retry_client_errors(sleeps):
+    throttle = ClusterThrottle("test-cluster", qps=1000, burst=1000)
+
+    def list_func():
+        raise ApiException(status=403, reason="Forbidden")
+
+    with pytest.raises(ApiException):
+        throttle.call(list_func)
+    assert sleeps == []
+    assert throttle.snapshot()["errors"] == 1
+
+def test_retry_after_is_capped(sleeps):
+    throttle = ClusterThrottle("test-cluster", qps=1000, burst=1000, max_retries=1)
+    responses = [_throttled("3600"), "ok"]
+
+    def list_func():
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    assert throttle.call(list_func) == "ok"
+    assert sleeps == [rate_limiter.BACKOFF_MAX_SECONDS]
+
+def test_invalid_cluster_settings_fall_back_to_defaults():
+    registry = ThrottleRegistry()
+    throttle = registry.get({"name": "small-cluster", "qps": 0, "burst": "lots"})
+    assert throttle.bucket.qps == rate_limiter.DEFAULT_QPS
+    assert throttle.bucket.burst == rate_limiter.DEFAULT_BURST
+
+    throttle = registry.get({"name": "slow-cluster", "qps": "0.5", "burst": 2})
+    assert throttle.bucket.qps == 0.5
+
+def test_collector_metrics_endpoint(monkeypatch):
+    registry = ThrottleRegistry()
+    registry.get({"name": "test-cluster"})._record(0.2)
+    monkeypatch.setattr("api.endpoints.throttle_registry", registry)
+
+    with TestClient(app) as client:
+        response = client.get("/api/collector/metrics")
+    assert response.status_code == 200
+    metrics = response.json()[0]
+    assert metrics["cluster_name"] == "test-cluster"
+    assert metrics["requests"] == 1
+    assert metrics["max_latency_seconds"] == pytest.approx(0.2)
@@ -1,5 +1,5 @@
 import os
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.errors import ConnectionFailure
 from dotenv import load_dotenv
 from .logger import logger
@@ -37,4 +37,57 @@ def get_audit_log_collection():
     """
     Returns a reference to the 'audit_logs' collection in the database.
     """
-    return db.audit_logs
\ No newline at end of file
+    return db.audit_logs
+
+def ensure_indexes():
+    """
+    Creates the indexes the collector and the API rely on. Safe to call on
+    every startup, as existing indexes are left untouched.
+    """
+    resources = get_resource_collection()
+    # Lookup of a single resource by the collector
+    resources.create_index([
+        ("cluster_name", ASCENDING),
+        ("resource_type", ASCENDING),
+        ("namespace", ASCENDING),
+        ("resource_name", ASCENDING),
+    ])
+    # Drift comparison of a named resource, or of a whole namespace, across clusters
+    resources.create_index([
+        ("resource_type", ASCENDING),
+        ("resource_name", ASCENDING),
+        ("content_digest", ASCENDING),
+    ])
+    resources.create_index([
+        ("resource_type", ASCENDING),
+        ("namespace", ASCENDING),
+        ("content_digest", ASCENDING),
+    ])
+    # Filtering on precomputed summaries, e.g. everything running an image,
+    # optionally narrowed to a type
+    resources.create_index([
+        ("summary.Containers.Image", ASCENDING),
+        ("resource_type", ASCENDING),
+    ])
+
+    audit_logs = get_audit_log_collection()
+    # History of a single resource, newest first
+    audit_logs.create_index([
+        ("resource_id", ASCENDING),
+        ("changed_at", DESCENDING),
+        ("_id", DESCENDING),
+    ])
+    # Changes within a cluster, optionally narrowed to a namespace and type
+    audit_logs.create_index([
+        ("cluster_name", ASCENDING),
+        ("namespace", ASCENDING),
+        ("resource_type", ASCENDING),
+        ("changed_at", DESCENDING),
+        ("_id", DESCENDING),
+    ])
+    # Changes across all clusters within a time range
+    audit_logs.create_index([
+        ("changed_at", DESCENDING),
+        ("_id", DESCENDING),
+    ])
+    logger.info("Database indexes ensured.")
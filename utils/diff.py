@@ -50,3 +50,27 @@ def get_diff(old, new, path=""):
         "modified": modified,
         "raw_diff": raw_diff
     }
+
+
+def get_changed_paths(old, new, path=""):
+    """
+    Recursively compares two nested dictionaries and returns the sorted list
+    of dotted paths that were added, removed, or modified. A cheaper variant
+    of `get_diff` for when only the locations of the changes are needed.
+    """
+    paths = []
+
+    for key in old.keys() | new.keys():
+        full_path = f"{path}.{key}" if path else key
+        if key not in old or key not in new:
+            paths.append(full_path)
+            continue
+
+        old_val = old[key]
+        new_val = new[key]
+        if isinstance(old_val, dict) and isinstance(new_val, dict):
+            paths.extend(get_changed_paths(old_val, new_val, path=full_path))
+        elif old_val != new_val:
+            paths.append(full_path)
+
+    return sorted(paths)
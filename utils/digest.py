@@ -0,0 +1,62 @@
+import hashlib
+import json
+
+# Metadata fields assigned by the API server. They differ between copies of
+# the "same" resource, so they are left out of the content digest.
+VOLATILE_METADATA_FIELDS = {
+    "uid",
+    "resourceVersion",
+    "creationTimestamp",
+    "generation",
+    "managedFields",
+    "selfLink",
+    "namespace",
+    "ownerReferences",
+}
+
+# Spec fields assigned by the API server or controllers, per resource type.
+VOLATILE_SPEC_FIELDS = {
+    "Service": {"clusterIP", "clusterIPs", "healthCheckNodePort"},
+    "PersistentVolumeClaim": {"volumeName"},
+    "PersistentVolume": {"claimRef"},
+    "Pod": {"nodeName"},
+}
+
+# Annotations written by tooling or controllers rather than by the user.
+VOLATILE_ANNOTATIONS = {
+    "kubectl.kubernetes.io/last-applied-configuration",
+    "deployment.kubernetes.io/revision",
+}
+
+def normalize_resource(data: dict, resource_type: str = None) -> dict:
+    """
+    Returns a copy of a resource with its status and server-assigned metadata
+    and spec fields removed, leaving only the content that is meaningful to
+    compare. Items of list responses carry no `kind`, so the type is passed in.
+    """
+    normalized = {k: v for k, v in data.items() if k != "status"}
+
+    volatile_spec_fields = VOLATILE_SPEC_FIELDS.get(resource_type or data.get("kind"))
+    if volatile_spec_fields and isinstance(data.get("spec"), dict):
+        normalized["spec"] = {k: v for k, v in data["spec"].items() if k not in volatile_spec_fields}
+
+    metadata = {
+        k: v for k, v in (data.get("metadata") or {}).items()
+        if k not in VOLATILE_METADATA_FIELDS
+    }
+    annotations = {
+        k: v for k, v in (metadata.get("annotations") or {}).items()
+        if k not in VOLATILE_ANNOTATIONS
+    }
+    if annotations:
+        metadata["annotations"] = annotations
+    else:
+        metadata.pop("annotations", None)
+
+    normalized["metadata"] = metadata
+    return normalized
+
+def compute_digest(data: dict, resource_type: str = None) -> str:
+    """Computes a stable SHA-256 digest of the normalized resource content."""
+    canonical = json.dumps(normalize_resource(data, resource_type), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,27 @@
+import os
+from .logger import logger
+
+def get_positive_int_env(name: str, default: int) -> int:
+    """
+    Reads a positive integer from an environment variable, falling back to
+    the default (with a warning) when it is missing or invalid.
+    """
+    try:
+        value = int(os.getenv(name, str(default)))
+        if value <= 0:
+            raise ValueError(f"{name} must be a positive integer.")
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid {name}. Defaulting to {default}.")
+        value = default
+    return value
+
+def get_positive_float_env(name: str, default: float) -> float:
+    """Like `get_positive_int_env`, for settings that may be fractional (e.g. a QPS of 0.5)."""
+    try:
+        value = float(os.getenv(name, str(default)))
+        if value <= 0:
+            raise ValueError(f"{name} must be a positive number.")
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid {name}. Defaulting to {default}.")
+        value = default
+    return value
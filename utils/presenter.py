@@ -1,3 +1,5 @@
+from typing import Optional
+
 def get_structured_data(resource: dict) -> dict:
     """
     Parses a resource dictionary and returns a structured summary.
@@ -8,41 +10,47 @@ def get_structured_data(resource: dict) -> dict:
     if not data:
         return {"Error": "No data available for this resource."}
 
-    presenter_functions = {
-        "deployment": present_deployment,
-        "service": present_service,
-        "secret": present_secret,
-        "ingress": present_ingress,
-        "configmap": present_configmap,
-    }
-
-    presenter_func = presenter_functions.get(resource_type)
+    presenter_func = PRESENTER_FUNCTIONS.get(resource_type)
     if presenter_func:
         return presenter_func(data)
 
     return {"Info": "Standard presentation for this resource type."}
 
-def present_deployment(data: dict) -> dict:
-    """Presents a summary of a Deployment."""
-    spec = data.get("spec", {})
-    status = data.get("status", {})
-    template_spec = spec.get("template", {}).get("spec", {})
+def build_summary(resource_type: str, data: dict) -> Optional[dict]:
+    """
+    Builds the summary stored alongside a resource at ingestion time.
+    Returns None for types without a presenter, and for ConfigMaps, whose
+    summary would just duplicate their data.
+    """
+    resource_type = resource_type.lower()
+    if not data or resource_type in UNSTORED_SUMMARY_TYPES:
+        return None
 
-    containers = template_spec.get("containers", [])
-    container_info = [
+    presenter_func = PRESENTER_FUNCTIONS.get(resource_type)
+    return presenter_func(data) if presenter_func else None
+
+def _present_containers(pod_spec: dict) -> list:
+    """Summarizes the image and ports of each container in a pod spec."""
+    return [
         {
             "Image": c.get("image"),
             "Ports": [p.get("containerPort") for p in c.get("ports", [])],
         }
-        for c in containers
+        for c in pod_spec.get("containers", [])
     ]
 
+def present_deployment(data: dict) -> dict:
+    """Presents a summary of a Deployment."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    template_spec = spec.get("template", {}).get("spec", {})
+
     return {
         "Replicas": spec.get("replicas"),
         "Available Replicas": status.get("availableReplicas"),
         "Ready Replicas": status.get("readyReplicas"),
         "Strategy": spec.get("strategy", {}).get("type"),
-        "Containers": container_info,
+        "Containers": _present_containers(template_spec),
     }
 
 def present_service(data: dict) -> dict:
@@ -90,4 +98,93 @@ def present_configmap(data: dict) -> dict:
     """Presents a summary of a ConfigMap."""
     # This is already handled by the special view in the template,
     # but we can return it here for consistency.
-    return data.get("data", {})
\ No newline at end of file
+    return data.get("data", {})
+
+def present_pod(data: dict) -> dict:
+    """Presents a summary of a Pod."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    ready = {cs.get("name"): cs.get("ready", False) for cs in status.get("containerStatuses", [])}
+
+    return {
+        "Status": status.get("phase"),
+        "Node": spec.get("nodeName"),
+        "IP": status.get("podIP"),
+        "Containers": [
+            {
+                "Name": c.get("name"),
+                "Image": c.get("image"),
+                "Ready": ready.get(c.get("name"), False),
+            }
+            for c in spec.get("containers", [])
+        ],
+    }
+
+def present_statefulset(data: dict) -> dict:
+    """Presents a summary of a StatefulSet."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    template_spec = spec.get("template", {}).get("spec", {})
+
+    return {
+        "Replicas": spec.get("replicas"),
+        "Ready Replicas": status.get("readyReplicas"),
+        "Service Name": spec.get("serviceName"),
+        "Update Strategy": spec.get("updateStrategy", {}).get("type"),
+        "Containers": _present_containers(template_spec),
+    }
+
+def present_job(data: dict) -> dict:
+    """Presents a summary of a Job."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    template_spec = spec.get("template", {}).get("spec", {})
+
+    return {
+        "Completions": spec.get("completions"),
+        "Parallelism": spec.get("parallelism"),
+        "Succeeded": status.get("succeeded"),
+        "Failed": status.get("failed"),
+        "Containers": _present_containers(template_spec),
+    }
+
+def present_persistentvolumeclaim(data: dict) -> dict:
+    """Presents a summary of a PersistentVolumeClaim."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    return {
+        "Status": status.get("phase"),
+        "Volume": spec.get("volumeName"),
+        "Capacity": status.get("capacity", {}).get("storage"),
+        "Access Modes": spec.get("accessModes"),
+        "Storage Class": spec.get("storageClassName"),
+    }
+
+def present_hpa(data: dict) -> dict:
+    """Presents a summary of a HorizontalPodAutoscaler."""
+    spec = data.get("spec", {})
+    status = data.get("status", {})
+    target = spec.get("scaleTargetRef", {})
+    return {
+        "Scale Target": f"{target.get('kind')}/{target.get('name')}",
+        "Min Replicas": spec.get("minReplicas"),
+        "Max Replicas": spec.get("maxReplicas"),
+        "Current Replicas": status.get("currentReplicas"),
+        "Target CPU Utilization": spec.get("targetCPUUtilizationPercentage"),
+    }
+
+PRESENTER_FUNCTIONS = {
+    "deployment": present_deployment,
+    "service": present_service,
+    "secret": present_secret,
+    "ingress": present_ingress,
+    "configmap": present_configmap,
+    "pod": present_pod,
+    "statefulset": present_statefulset,
+    "job": present_job,
+    "persistentvolumeclaim": present_persistentvolumeclaim,
+    "horizontalpodautoscaler": present_hpa,
+}
+
+# Types whose summary is not worth storing at ingestion time.
+UNSTORED_SUMMARY_TYPES = {"configmap"}